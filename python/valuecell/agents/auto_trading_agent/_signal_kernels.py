@@ -0,0 +1,76 @@
+"""Indicator signal classification kernels.
+
+Maps raw indicator values to small integer class codes so callers can look
+up display labels from parallel tuples instead of re-branching per call.
+The batch variants operate on NumPy columns for multi-symbol portfolio
+scans.
+"""
+
+import numpy as np
+
+# Display labels indexed by the class codes returned below
+MACD_LABELS = ("🔴 Bearish", "🟢 Bullish")
+RSI_LABELS = ("⚪ Neutral", "🟢 Oversold", "🔴 Overbought")
+EMA_LABELS = ("🔴 Bearish", "🟢 Bullish")
+BB_LABELS = ("⚪ Within Bands", "🟢 Below Lower Band", "🔴 Above Upper Band")
+
+
+def classify_macd(macd: float, macd_signal: float) -> int:
+    """0 = bearish, 1 = bullish (MACD above its signal line)."""
+    return int(macd > macd_signal)
+
+
+def classify_rsi(rsi: float) -> int:
+    """0 = neutral, 1 = oversold (<30), 2 = overbought (>70)."""
+    if rsi < 30:
+        return 1
+    if rsi > 70:
+        return 2
+    return 0
+
+
+def classify_ema(ema_12: float, ema_26: float) -> int:
+    """0 = bearish, 1 = bullish (fast EMA above slow EMA)."""
+    return int(ema_12 > ema_26)
+
+
+def classify_bb(close: float, bb_upper: float, bb_lower: float) -> int:
+    """0 = within bands, 1 = below lower band, 2 = above upper band."""
+    if close < bb_lower:
+        return 1
+    if close > bb_upper:
+        return 2
+    return 0
+
+
+def classify_batch(
+    close: np.ndarray,
+    macd: np.ndarray,
+    macd_signal: np.ndarray,
+    rsi: np.ndarray,
+    ema_12: np.ndarray,
+    ema_26: np.ndarray,
+    bb_upper: np.ndarray,
+    bb_lower: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Classify indicator columns for many symbols in one vectorized pass.
+
+    Args:
+        close, macd, macd_signal, rsi, ema_12, ema_26, bb_upper, bb_lower:
+            Aligned 1-D arrays, one entry per symbol
+
+    Returns:
+        Tuple of (macd_codes, rsi_codes, ema_codes, bb_codes) int8 arrays
+        using the same class codes as the scalar helpers
+    """
+    close = np.asarray(close)
+    rsi = np.asarray(rsi)
+
+    macd_codes = (np.asarray(macd) > np.asarray(macd_signal)).astype(np.int8)
+    rsi_codes = np.where(rsi < 30, 1, np.where(rsi > 70, 2, 0)).astype(np.int8)
+    ema_codes = (np.asarray(ema_12) > np.asarray(ema_26)).astype(np.int8)
+    bb_codes = np.where(
+        close < np.asarray(bb_lower), 1, np.where(close > np.asarray(bb_upper), 2, 0)
+    ).astype(np.int8)
+
+    return macd_codes, rsi_codes, ema_codes, bb_codes
@@ -15,5 +15,8 @@ ENV_PARSER_MODEL_ID = "AUTO_TRADING_PARSER_MODEL_ID"
 ENV_SIGNAL_MODEL_ID = "AUTO_TRADING_SIGNAL_MODEL_ID"
 ENV_PRIMARY_MODEL_ID = "AUTO_TRADING_AGENT_MODEL_ID"
 
+# Set to "false" to suppress notification formatting entirely
+ENV_NOTIFICATIONS_ENABLED = "AUTO_TRADING_NOTIFICATIONS_ENABLED"
+
 # Deprecated (kept for backward compatibility)
 DEFAULT_AGENT_MODEL = "deepseek/deepseek-v3.1-terminus"
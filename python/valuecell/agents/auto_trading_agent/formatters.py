@@ -2,308 +2,403 @@
 
 import json
 import logging
-from datetime import datetime, timezone
+import os
+from datetime import datetime, timezone, tzinfo
+from functools import lru_cache
+from string import Template
 from typing import Any, Dict, Optional
-
-from ...utils.i18n_utils import convert_timezone, get_current_timezone
+from zoneinfo import ZoneInfo
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from ...utils.i18n_utils import get_current_timezone
+from ._signal_kernels import (
+    BB_LABELS,
+    EMA_LABELS,
+    MACD_LABELS,
+    RSI_LABELS,
+    classify_bb,
+    classify_ema,
+    classify_macd,
+    classify_rsi,
+)
+from .constants import ENV_NOTIFICATIONS_ENABLED
 from .models import Position, TechnicalIndicators, TradeAction, TradeType
 
 logger = logging.getLogger(__name__)
 
+# Resolved once at import; when notifications are suppressed every formatter
+# returns immediately instead of building messages that are discarded.
+_NOTIFICATIONS_ENABLED = os.getenv(ENV_NOTIFICATIONS_ENABLED, "true").lower() != "false"
+
+if orjson is not None:
+
+    def _dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode("utf-8")
+else:
+    _dumps = json.dumps
+
+# Emoji lookup tables shared by the notification formatters; built once at
+# import time so hot formatting paths avoid per-call dict literals.
+_ACTION_EMOJI = {
+    TradeAction.BUY: "🟢",
+    TradeAction.SELL: "🔴",
+    TradeAction.HOLD: "⏸️",
+}
+# Indexed by bool(pnl >= 0)
+_PNL_EMOJI = ("🔴", "🟢")
+_PNL_SIGN = ("", "+")
+# PnL direction per trade type: longs gain when price rises, shorts when it falls
+_PNL_DIRECTION = {TradeType.LONG: 1.0, TradeType.SHORT: -1.0}
+
+# Trade-notification skeletons, parsed and interned once at import; each
+# notification is a single format_map() pass over a prepared context dict.
+_TRADE_OPENED_TMPL = (
+    "**{agent_name}** opened a **{trade_type}** position on **{symbol}**!\n\n"
+    "📅 {time}\n\n"
+    "**Price:** `${entry_price:,.2f}`\n\n"
+    "**Quantity:** `{quantity:.4f}`\n\n"
+    "**Notional:** `${notional:,.2f}`"
+)
+_TRADE_CLOSED_TMPL = (
+    "**{agent_name}** completed a **{trade_type}** trade on **{symbol}**!\n\n"
+    "📅 {time}\n\n"
+    "**Price:** `${entry_price:,.2f}` → `${exit_price:,.2f}`\n\n"
+    "**Quantity:** `{quantity:.4f}`\n\n"
+    "**Notional:** `${entry_notional:,.2f}` → `${exit_notional:,.2f}`\n\n"
+    "**Holding time:** `{hours}H {minutes}M`\n\n"
+    "**Net P&L:** {pnl_emoji} **{pnl_sign}${pnl:,.2f}**"
+)
+
+# Precompiled skeletons for the market-analysis message, built once at import
+# time; substitution values are pre-formatted strings.
+_MA_HEADER_TMPL = Template(
+    "📊 **Market Analysis - ${symbol}**\n"
+    "Time: ${time}\n\n"
+    "**Current Price:** $$${price}\n"
+    "**Decision:** ${emoji} ${decision}"
+)
+_MA_POSITION_TMPL = Template(
+    "\n**Current Position:**\n"
+    "- Type: ${type}\n"
+    "- Entry: $$${entry}\n"
+    "- Quantity: ${quantity}\n"
+    "- Unrealized P&L: ${emoji} $$${pnl}\n"
+)
+_MA_NO_POSITION_TMPL = Template(
+    "\n**Current Position:** No open position for ${symbol}\n\n"
+)
+
+
+@lru_cache(maxsize=8)
+def _get_tz(name: str) -> tzinfo:
+    """Resolve a timezone name to a tzinfo object, cached per name.
+
+    Notifications are formatted in tight trading loops; caching avoids
+    re-reading tz database entries on every call.
+    """
+    return ZoneInfo(name)
+
+
+def _ensure_utc(dt: datetime) -> datetime:
+    """Coerce a naive datetime to UTC; tz-aware datetimes pass through."""
+    return dt.replace(tzinfo=timezone.utc) if dt.tzinfo is None else dt
+
+
+def _convert_and_format_timestamp(
+    dt: datetime, format_str: str = "%m/%d, %I:%M %p", include_tz: bool = False
+) -> str:
+    """
+    Convert timestamp to user's timezone and format it.
+
+    Args:
+        dt: DateTime to convert and format
+        format_str: Format string for strftime
+        include_tz: Whether to include timezone abbreviation
+
+    Returns:
+        Formatted timestamp string
+    """
+    try:
+        # Get user's configured timezone
+        user_tz = get_current_timezone()
+
+        # Fast path: input is treated as UTC, so a UTC user needs no
+        # conversion at all
+        if user_tz == "UTC":
+            formatted = dt.strftime(format_str)
+            return f"{formatted} (UTC)" if include_tz else formatted
+
+        # Convert from UTC to user's timezone
+        # Assume input is UTC if no timezone info
+        converted_dt = _ensure_utc(dt).astimezone(_get_tz(user_tz))
+
+        # Format the datetime
+        formatted = converted_dt.strftime(format_str)
+
+        # Optionally append timezone info
+        if include_tz:
+            formatted += f" ({user_tz})"
+
+        return formatted
+    except Exception as e:
+        logger.warning("Failed to convert timezone: %s, using UTC", e)
+        # Fallback to UTC format
+        return _ensure_utc(dt).strftime(format_str)
+
+
+def format_trade_notification(
+    trade_details: Dict[str, Any], agent_name: str = "AutoTrading"
+) -> str:
+    """
+    Format trade details into a notification message
+
+    Args:
+        trade_details: Trade execution details
+        agent_name: Name of the agent
+
+    Returns:
+        Formatted notification message
+    """
+    if not _NOTIFICATIONS_ENABLED:
+        return ""
+
+    try:
+        symbol = trade_details["symbol"]
+        action = trade_details["action"]
+        trade_type = trade_details["trade_type"]
+        timestamp = trade_details["timestamp"]
+
+        # Convert timestamp to user's timezone
+        formatted_time = _convert_and_format_timestamp(timestamp)
+
+        ctx = {
+            "agent_name": agent_name,
+            "trade_type": trade_type,
+            "symbol": symbol,
+            "time": formatted_time,
+            "entry_price": trade_details["entry_price"],
+            "quantity": trade_details["quantity"],
+        }
+
+        if action == "opened":
+            ctx["notional"] = trade_details["notional"]
+            return _TRADE_OPENED_TMPL.format_map(ctx)
+
+        # closed
+        total_s = int(trade_details["holding_time"].total_seconds())
+        hours, minutes = divmod(total_s // 60, 60)
+        pnl = trade_details["pnl"]
+        ctx.update(
+            exit_price=trade_details["exit_price"],
+            entry_notional=trade_details["entry_notional"],
+            exit_notional=trade_details["exit_notional"],
+            hours=hours,
+            minutes=minutes,
+            pnl=pnl,
+            pnl_sign=_PNL_SIGN[pnl >= 0],
+            pnl_emoji=_PNL_EMOJI[pnl >= 0],
+        )
+        return _TRADE_CLOSED_TMPL.format_map(ctx)
+
+    except Exception as e:
+        logger.error("Failed to format trade notification: %s", e)
+        return "Trade executed"
+
+
+def format_portfolio_notification(
+    portfolio_value: float,
+    positions_count: int,
+    current_capital: float,
+    agent_model: str,
+    session_id: str,
+    portfolio_history: list,
+) -> tuple[str, Optional[str]]:
+    """
+    Format portfolio value notification for chart rendering
+
+    Args:
+        portfolio_value: Current portfolio value
+        positions_count: Number of open positions
+        current_capital: Available capital
+        agent_model: Agent model name
+        session_id: Current session ID
+        portfolio_history: Historical portfolio data
+
+    Returns:
+        Tuple of (display message, chart data JSON)
+    """
+    if not _NOTIFICATIONS_ENABLED:
+        return "", None
+
+    try:
+        timestamp = datetime.now(timezone.utc)
+        timestamp_iso = timestamp.isoformat()
+
+        # Append to history
+        portfolio_history.append({"timestamp": timestamp_iso, "value": portfolio_value})
+
+        # Create chart data payload
+        chart_data = {
+            "id": f"AutoTradingAgent-{agent_model}",
+            "filters": [
+                {"dimension": "Time", "gte": timestamp_iso},
+                {"dimension": "Model", "=": agent_model},
+            ],
+            "data": {"Portfolio": portfolio_value},
+        }
+
+        # Convert timestamp to user's timezone for display
+        formatted_time = _convert_and_format_timestamp(
+            timestamp, format_str="%m/%d, %I:%M %p", include_tz=True
+        )
+
+        display_message = (
+            f"💰 Portfolio Update\n"
+            f"Time: {formatted_time}\n"
+            f"Total Value: ${portfolio_value:,.2f}\n"
+            f"Open Positions: {positions_count}\n"
+            f"Available Capital: ${current_capital:,.2f}"
+        )
+
+        return display_message, _dumps(chart_data)
+
+    except Exception as e:
+        logger.error("Failed to format portfolio notification: %s", e)
+        return "Portfolio update failed", None
+
+
+def format_market_analysis_notification(
+    symbol: str,
+    indicators: TechnicalIndicators,
+    action: TradeAction,
+    trade_type: TradeType,
+    positions: Dict[str, Position],
+    ai_reasoning: Optional[str] = None,
+) -> str:
+    """
+    Format market analysis notification including HOLD decisions
+
+    Args:
+        symbol: Trading symbol
+        indicators: Technical indicators
+        action: Recommended action
+        trade_type: Trade type
+        positions: Current positions dictionary
+        ai_reasoning: AI reasoning if available
+
+    Returns:
+        Formatted analysis message
+    """
+    if not _NOTIFICATIONS_ENABLED:
+        return ""
+
+    try:
+        timestamp = datetime.now(timezone.utc)
+
+        # Convert timestamp to user's timezone for display
+        formatted_time = _convert_and_format_timestamp(
+            timestamp, format_str="%m/%d, %I:%M %p", include_tz=True
+        )
+
+        hold = TradeAction.HOLD
+
+        # Build the message as a list of parts and join once, avoiding
+        # repeated str concatenation on a growing buffer.
+        parts: list = [
+            _MA_HEADER_TMPL.substitute(
+                symbol=symbol,
+                time=formatted_time,
+                price=f"{indicators.close_price:,.2f}",
+                emoji=_ACTION_EMOJI.get(action, ""),
+                decision=action.value.upper(),
+            )
+        ]
 
-class MessageFormatter:
-    """Formats various messages and notifications"""
-
-    @staticmethod
-    def _convert_and_format_timestamp(
-        dt: datetime, format_str: str = "%m/%d, %I:%M %p", include_tz: bool = False
-    ) -> str:
-        """
-        Convert timestamp to user's timezone and format it.
-
-        Args:
-            dt: DateTime to convert and format
-            format_str: Format string for strftime
-            include_tz: Whether to include timezone abbreviation
-
-        Returns:
-            Formatted timestamp string
-        """
-        try:
-            # Get user's configured timezone
-            user_tz = get_current_timezone()
-
-            # Convert from UTC to user's timezone
-            # Assume input is UTC if no timezone info
-            if dt.tzinfo is None:
-                dt = datetime(
-                    dt.year,
-                    dt.month,
-                    dt.day,
-                    dt.hour,
-                    dt.minute,
-                    dt.second,
-                    tzinfo=timezone.utc,
-                )
+        if action != hold:
+            parts.append(f" ({trade_type.value.upper()})")
 
-            converted_dt = convert_timezone(dt, "UTC", user_tz)
-
-            # Format the datetime
-            formatted = converted_dt.strftime(format_str)
-
-            # Optionally append timezone info
-            if include_tz:
-                formatted += f" ({user_tz})"
-
-            return formatted
-        except Exception as e:
-            logger.warning(f"Failed to convert timezone: {e}, using UTC")
-            # Fallback to UTC format
-            if dt.tzinfo is None:
-                dt = datetime(
-                    dt.year,
-                    dt.month,
-                    dt.day,
-                    dt.hour,
-                    dt.minute,
-                    dt.second,
-                    tzinfo=timezone.utc,
-                )
-            return dt.strftime(format_str)
-
-    @staticmethod
-    def format_trade_notification(
-        trade_details: Dict[str, Any], agent_name: str = "AutoTrading"
-    ) -> str:
-        """
-        Format trade details into a notification message
-
-        Args:
-            trade_details: Trade execution details
-            agent_name: Name of the agent
-
-        Returns:
-            Formatted notification message
-        """
-        try:
-            symbol = trade_details["symbol"]
-            action = trade_details["action"]
-            trade_type = trade_details["trade_type"]
-            timestamp = trade_details["timestamp"]
-
-            # Convert timestamp to user's timezone
-            formatted_time = MessageFormatter._convert_and_format_timestamp(timestamp)
-
-            if action == "opened":
-                message = (
-                    f"**{agent_name}** opened a **{trade_type}** position on **{symbol}**!\n\n"
-                    f"📅 {formatted_time}\n\n"
-                    f"**Price:** `${trade_details['entry_price']:,.2f}`\n\n"
-                    f"**Quantity:** `{trade_details['quantity']:.4f}`\n\n"
-                    f"**Notional:** `${trade_details['notional']:,.2f}`"
-                )
-            else:  # closed
-                hours = int(trade_details["holding_time"].total_seconds() // 3600)
-                minutes = int(
-                    (trade_details["holding_time"].total_seconds() % 3600) // 60
-                )
-                pnl = trade_details["pnl"]
-                pnl_sign = "+" if pnl >= 0 else ""
-                pnl_emoji = "🟢" if pnl >= 0 else "🔴"
-
-                message = (
-                    f"**{agent_name}** completed a **{trade_type}** trade on **{symbol}**!\n\n"
-                    f"📅 {formatted_time}\n\n"
-                    f"**Price:** `${trade_details['entry_price']:,.2f}` → `${trade_details['exit_price']:,.2f}`\n\n"
-                    f"**Quantity:** `{trade_details['quantity']:.4f}`\n\n"
-                    f"**Notional:** `${trade_details['entry_notional']:,.2f}` → `${trade_details['exit_notional']:,.2f}`\n\n"
-                    f"**Holding time:** `{hours}H {minutes}M`\n\n"
-                    f"**Net P&L:** {pnl_emoji} **{pnl_sign}${pnl:,.2f}**"
-                )
+        parts.append("\n\n**Technical Indicators:**\n")
 
-            return message
-
-        except Exception as e:
-            logger.error(f"Failed to format trade notification: {e}")
-            return "Trade executed"
-
-    @staticmethod
-    def format_portfolio_notification(
-        portfolio_value: float,
-        positions_count: int,
-        current_capital: float,
-        agent_model: str,
-        session_id: str,
-        portfolio_history: list,
-    ) -> tuple[str, Optional[str]]:
-        """
-        Format portfolio value notification for chart rendering
-
-        Args:
-            portfolio_value: Current portfolio value
-            positions_count: Number of open positions
-            current_capital: Available capital
-            agent_model: Agent model name
-            session_id: Current session ID
-            portfolio_history: Historical portfolio data
-
-        Returns:
-            Tuple of (display message, chart data JSON)
-        """
-        try:
-            timestamp = datetime.now(timezone.utc)
-
-            # Append to history
-            portfolio_history.append(
-                {"timestamp": timestamp.isoformat(), "value": portfolio_value}
+        # Add MACD
+        if indicators.macd is not None and indicators.macd_signal is not None:
+            macd_signal = MACD_LABELS[
+                classify_macd(indicators.macd, indicators.macd_signal)
+            ]
+            parts.append(
+                f"- MACD: {indicators.macd:.4f} / Signal: {indicators.macd_signal:.4f} ({macd_signal})\n"
             )
 
-            # Create chart data payload
-            chart_data = {
-                "id": f"AutoTradingAgent-{agent_model}",
-                "filters": [
-                    {"dimension": "Time", "gte": timestamp.isoformat()},
-                    {"dimension": "Model", "=": agent_model},
-                ],
-                "data": {"Portfolio": portfolio_value},
-            }
-
-            # Convert timestamp to user's timezone for display
-            formatted_time = MessageFormatter._convert_and_format_timestamp(
-                timestamp, format_str="%m/%d, %I:%M %p", include_tz=True
-            )
+        # Add RSI
+        if indicators.rsi is not None:
+            rsi_signal = RSI_LABELS[classify_rsi(indicators.rsi)]
+            parts.append(f"- RSI: {indicators.rsi:.2f} ({rsi_signal})\n")
 
-            display_message = (
-                f"💰 Portfolio Update\n"
-                f"Time: {formatted_time}\n"
-                f"Total Value: ${portfolio_value:,.2f}\n"
-                f"Open Positions: {positions_count}\n"
-                f"Available Capital: ${current_capital:,.2f}"
+        # Add EMAs
+        if indicators.ema_12 is not None and indicators.ema_26 is not None:
+            ema_signal = EMA_LABELS[classify_ema(indicators.ema_12, indicators.ema_26)]
+            parts.append(
+                f"- EMA 12/26: ${indicators.ema_12:,.2f} / ${indicators.ema_26:,.2f} ({ema_signal})\n"
             )
 
-            return display_message, json.dumps(chart_data)
-
-        except Exception as e:
-            logger.error(f"Failed to format portfolio notification: {e}")
-            return "Portfolio update failed", None
-
-    @staticmethod
-    def format_market_analysis_notification(
-        symbol: str,
-        indicators: TechnicalIndicators,
-        action: TradeAction,
-        trade_type: TradeType,
-        positions: Dict[str, Position],
-        ai_reasoning: Optional[str] = None,
-    ) -> str:
-        """
-        Format market analysis notification including HOLD decisions
-
-        Args:
-            symbol: Trading symbol
-            indicators: Technical indicators
-            action: Recommended action
-            trade_type: Trade type
-            positions: Current positions dictionary
-            ai_reasoning: AI reasoning if available
-
-        Returns:
-            Formatted analysis message
-        """
-        try:
-            timestamp = datetime.now(timezone.utc)
-
-            # Convert timestamp to user's timezone for display
-            formatted_time = MessageFormatter._convert_and_format_timestamp(
-                timestamp, format_str="%m/%d, %I:%M %p", include_tz=True
+        # Add Bollinger Bands
+        if indicators.bb_upper is not None and indicators.bb_lower is not None:
+            bb_signal = BB_LABELS[
+                classify_bb(
+                    indicators.close_price,
+                    indicators.bb_upper,
+                    indicators.bb_lower,
+                )
+            ]
+            parts.append(
+                f"- Bollinger Bands: ${indicators.bb_lower:,.2f} - ${indicators.bb_upper:,.2f} ({bb_signal})\n"
             )
 
-            # Format action with emoji
-            action_emoji = {
-                TradeAction.BUY: "🟢",
-                TradeAction.SELL: "🔴",
-                TradeAction.HOLD: "⏸️",
-            }
-
-            message = (
-                f"📊 **Market Analysis - {symbol}**\n"
-                f"Time: {formatted_time}\n\n"
-                f"**Current Price:** ${indicators.close_price:,.2f}\n"
-                f"**Decision:** {action_emoji.get(action, '')} {action.value.upper()}"
+        # Add AI reasoning if available
+        if ai_reasoning:
+            parts.append(f"\n**AI Analysis:**\n{ai_reasoning}\n")
+
+        # Add current position info if exists
+        if symbol in positions:
+            pos = positions[symbol]
+            current_pnl = (
+                _PNL_DIRECTION[pos.trade_type]
+                * (indicators.close_price - pos.entry_price)
+                * abs(pos.quantity)
             )
 
-            if action != TradeAction.HOLD:
-                message += f" ({trade_type.value.upper()})"
+            parts.append(
+                _MA_POSITION_TMPL.substitute(
+                    type=pos.trade_type.value.upper(),
+                    entry=f"{pos.entry_price:,.2f}",
+                    quantity=f"{abs(pos.quantity):.4f}",
+                    emoji=_PNL_EMOJI[current_pnl >= 0],
+                    pnl=f"{current_pnl:,.2f}",
+                )
+            )
+        else:
+            parts.append(_MA_NO_POSITION_TMPL.substitute(symbol=symbol))
 
-            message += "\n\n**Technical Indicators:**\n"
+        return "".join(parts)
 
-            # Add MACD
-            if indicators.macd is not None and indicators.macd_signal is not None:
-                macd_signal = (
-                    "🟢 Bullish"
-                    if indicators.macd > indicators.macd_signal
-                    else "🔴 Bearish"
-                )
-                message += f"- MACD: {indicators.macd:.4f} / Signal: {indicators.macd_signal:.4f} ({macd_signal})\n"
-
-            # Add RSI
-            if indicators.rsi is not None:
-                rsi_signal = (
-                    "🟢 Oversold"
-                    if indicators.rsi < 30
-                    else ("🔴 Overbought" if indicators.rsi > 70 else "⚪ Neutral")
-                )
-                message += f"- RSI: {indicators.rsi:.2f} ({rsi_signal})\n"
-
-            # Add EMAs
-            if indicators.ema_12 is not None and indicators.ema_26 is not None:
-                ema_signal = (
-                    "🟢 Bullish"
-                    if indicators.ema_12 > indicators.ema_26
-                    else "🔴 Bearish"
-                )
-                message += f"- EMA 12/26: ${indicators.ema_12:,.2f} / ${indicators.ema_26:,.2f} ({ema_signal})\n"
-
-            # Add Bollinger Bands
-            if indicators.bb_upper is not None and indicators.bb_lower is not None:
-                if indicators.close_price > indicators.bb_upper:
-                    bb_signal = "🔴 Above Upper Band"
-                elif indicators.close_price < indicators.bb_lower:
-                    bb_signal = "🟢 Below Lower Band"
-                else:
-                    bb_signal = "⚪ Within Bands"
-                message += f"- Bollinger Bands: ${indicators.bb_lower:,.2f} - ${indicators.bb_upper:,.2f} ({bb_signal})\n"
-
-            # Add AI reasoning if available
-            if ai_reasoning:
-                message += f"\n**AI Analysis:**\n{ai_reasoning}\n"
-
-            # Add current position info if exists
-            if symbol in positions:
-                pos = positions[symbol]
-                current_pnl = 0
-                if pos.trade_type == TradeType.LONG:
-                    current_pnl = (indicators.close_price - pos.entry_price) * abs(
-                        pos.quantity
-                    )
-                else:
-                    current_pnl = (pos.entry_price - indicators.close_price) * abs(
-                        pos.quantity
-                    )
-
-                pnl_emoji = "🟢" if current_pnl >= 0 else "🔴"
-                message += (
-                    f"\n**Current Position:**\n"
-                    f"- Type: {pos.trade_type.value.upper()}\n"
-                    f"- Entry: ${pos.entry_price:,.2f}\n"
-                    f"- Quantity: {abs(pos.quantity):.4f}\n"
-                    f"- Unrealized P&L: {pnl_emoji} ${current_pnl:,.2f}\n"
-                )
-            else:
-                message += f"\n**Current Position:** No open position for {symbol}\n\n"
+    except Exception as e:
+        logger.error("Failed to format market analysis notification: %s", e)
+        return f"Market analysis for {symbol}"
 
-            return message
 
-        except Exception as e:
-            logger.error(f"Failed to format market analysis notification: {e}")
-            return f"Market analysis for {symbol}"
+class MessageFormatter:
+    """Backward-compatible namespace for the module-level formatters.
+
+    New code should call the module-level functions directly; going through
+    the class adds an attribute lookup per call.
+    """
+
+    _convert_and_format_timestamp = staticmethod(_convert_and_format_timestamp)
+    format_trade_notification = staticmethod(format_trade_notification)
+    format_portfolio_notification = staticmethod(format_portfolio_notification)
+    format_market_analysis_notification = staticmethod(
+        format_market_analysis_notification
+    )
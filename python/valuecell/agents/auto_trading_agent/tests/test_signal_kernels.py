@@ -0,0 +1,51 @@
+import numpy as np
+
+from valuecell.agents.auto_trading_agent._signal_kernels import (
+    BB_LABELS,
+    EMA_LABELS,
+    MACD_LABELS,
+    RSI_LABELS,
+    classify_batch,
+    classify_bb,
+    classify_ema,
+    classify_macd,
+    classify_rsi,
+)
+
+
+def test_scalar_codes_index_labels():
+    assert MACD_LABELS[classify_macd(1.0, 0.5)] == "🟢 Bullish"
+    assert MACD_LABELS[classify_macd(0.5, 1.0)] == "🔴 Bearish"
+    assert RSI_LABELS[classify_rsi(25.0)] == "🟢 Oversold"
+    assert RSI_LABELS[classify_rsi(75.0)] == "🔴 Overbought"
+    assert RSI_LABELS[classify_rsi(50.0)] == "⚪ Neutral"
+    assert EMA_LABELS[classify_ema(11.0, 10.0)] == "🟢 Bullish"
+    assert BB_LABELS[classify_bb(9.0, 12.0, 10.0)] == "🟢 Below Lower Band"
+    assert BB_LABELS[classify_bb(13.0, 12.0, 10.0)] == "🔴 Above Upper Band"
+    assert BB_LABELS[classify_bb(11.0, 12.0, 10.0)] == "⚪ Within Bands"
+
+
+def test_classify_batch_matches_scalar_helpers():
+    # Rows cover every branch: oversold/overbought/neutral RSI, both MACD and
+    # EMA orientations, and below/within/above band closes.
+    close = np.array([9.0, 11.0, 13.0, 10.5, 11.5])
+    macd = np.array([1.0, -1.0, 0.5, 0.0, 2.0])
+    macd_signal = np.array([0.5, -0.5, 0.5, 1.0, 1.0])
+    rsi = np.array([25.0, 75.0, 50.0, 30.0, 70.0])
+    ema_12 = np.array([11.0, 9.0, 10.0, 12.0, 8.0])
+    ema_26 = np.array([10.0, 10.0, 10.0, 11.0, 9.0])
+    bb_upper = np.array([12.0, 12.0, 12.0, 12.0, 12.0])
+    bb_lower = np.array([10.0, 10.0, 10.0, 10.0, 10.0])
+
+    macd_codes, rsi_codes, ema_codes, bb_codes = classify_batch(
+        close, macd, macd_signal, rsi, ema_12, ema_26, bb_upper, bb_lower
+    )
+
+    for i in range(close.size):
+        assert macd_codes[i] == classify_macd(macd[i], macd_signal[i])
+        assert rsi_codes[i] == classify_rsi(rsi[i])
+        assert ema_codes[i] == classify_ema(ema_12[i], ema_26[i])
+        assert bb_codes[i] == classify_bb(close[i], bb_upper[i], bb_lower[i])
+
+    for codes in (macd_codes, rsi_codes, ema_codes, bb_codes):
+        assert codes.dtype == np.int8
@@ -1,9 +1,10 @@
 """Super agent service exports."""
 
-from .core import SuperAgentDecision, SuperAgentOutcome
+from .core import SUPER_AGENT_OUTPUT_SCHEMA, SuperAgentDecision, SuperAgentOutcome
 from .service import SuperAgentService
 
 __all__ = [
+    "SUPER_AGENT_OUTPUT_SCHEMA",
     "SuperAgentDecision",
     "SuperAgentOutcome",
     "SuperAgentService",
@@ -1,18 +1,35 @@
 import asyncio
+import hashlib
+import logging
+import re
 from enum import Enum
-from typing import Optional
+from typing import Dict, Optional
 
 from agno.agent import Agent
 from agno.db.in_memory import InMemoryDb
 from pydantic import BaseModel, Field
 
 import valuecell.utils.model as model_utils_mod
-from valuecell.core.super_agent.prompts import (
-    SUPER_AGENT_EXPECTED_OUTPUT,
-    SUPER_AGENT_INSTRUCTION,
-)
+
+# Import the module, not the constants: prompt bodies are loaded lazily on
+# first attribute access, so processes that import this module without ever
+# constructing a SuperAgent pay no prompt I/O.
+from valuecell.core.super_agent import prompts as prompts_mod
 from valuecell.core.types import UserInput
 from valuecell.utils.env import agent_debug_mode_enabled
+from valuecell.utils.i18n_utils import detect_language_hint
+
+logger = logging.getLogger(__name__)
+
+# Cap on how much of a malformed model response is echoed back to the user
+_MALFORMED_PREVIEW_MAX = 512
+
+# In-flight triage calls keyed on (prompt revision, user, conversation,
+# query); concurrent duplicates await the same task instead of re-running
+# the LLM call. No completed-result cache is kept on purpose: triage depends
+# on conversation history, so a repeat of the same query later is not
+# idempotent.
+_INFLIGHT: Dict[bytes, "asyncio.Task"] = {}
 
 
 class SuperAgentDecision(str, Enum):
@@ -32,6 +49,59 @@ class SuperAgentOutcome(BaseModel):
     reason: Optional[str] = Field(None, description="Brief rationale for the decision")
 
 
+# Compiled JSON schema of the triage outcome, computed once at import.
+# The Agent below already enforces structure via output_schema/use_json_mode;
+# this constant is for callers talking to backends that take a raw schema
+# constraint (e.g. guided_json / response_format) instead of a pydantic model.
+SUPER_AGENT_OUTPUT_SCHEMA = SuperAgentOutcome.model_json_schema()
+
+# Prebuilt fallback outcome; the hot malformed-response path copies this with
+# model_copy() instead of re-running pydantic validation per response.
+_MALFORMED_OUTCOME_TEMPLATE = SuperAgentOutcome(decision=SuperAgentDecision.ANSWER)
+
+# Trivial queries answered without an LLM round-trip. Compiled once at
+# import; keep the list conservative — anything with actual intent must
+# still reach the model.
+_FAST_PATH_RESPONSES = (
+    (
+        re.compile(
+            r"^(hi|hello|hey|good (morning|afternoon|evening))[\s!.?]*$",
+            re.IGNORECASE,
+        ),
+        "Hello! How can I help you today?",
+    ),
+    (
+        re.compile(r"^(thanks|thank you|thx)[\s!.?]*$", re.IGNORECASE),
+        "You're welcome! Let me know if there's anything else I can help with.",
+    ),
+    (
+        re.compile(r"^(bye|goodbye|see you)[\s!.?]*$", re.IGNORECASE),
+        "Goodbye! Feel free to come back anytime.",
+    ),
+)
+# Trivial queries are short; skip the pattern scan for anything longer
+_FAST_PATH_MAX_LEN = 32
+
+
+def try_fast_answer(query: str) -> Optional[SuperAgentOutcome]:
+    """Return a canned ANSWER outcome for trivial queries, else None.
+
+    Greetings and similar pleasantries satisfy the decision matrix without
+    a model call; matching them here skips the whole prefill+decode cost.
+    """
+    stripped = query.strip()
+    if not stripped or len(stripped) > _FAST_PATH_MAX_LEN:
+        return None
+    for pattern, answer in _FAST_PATH_RESPONSES:
+        if pattern.match(stripped):
+            return SuperAgentOutcome(
+                decision=SuperAgentDecision.ANSWER,
+                answer_content=answer,
+                reason="Trivial query answered without model call",
+            )
+    return None
+
+
 class SuperAgent:
     """Lightweight Super Agent that triages user intent before planning.
 
@@ -42,48 +112,103 @@ class SuperAgent:
 
     name: str = "ValueCellAgent"
 
+    # Process-local cache of configured Agent instances, keyed on the Agent
+    # implementation and the resolved model. Re-instantiating SuperAgent per
+    # request then reuses the Agent (and its in-memory db) instead of
+    # re-running model capability checks and agent configuration.
+    _agent_cache: dict = {}
+
     def __init__(self) -> None:
         model = model_utils_mod.get_model_for_agent("super_agent")
-        self.agent = Agent(
-            model=model,
-            # TODO: enable tools when needed
-            # tools=[Crawl4aiTools()],
-            markdown=False,
-            debug_mode=agent_debug_mode_enabled(),
-            instructions=[SUPER_AGENT_INSTRUCTION],
-            # output format
-            expected_output=SUPER_AGENT_EXPECTED_OUTPUT,
-            output_schema=SuperAgentOutcome,
-            use_json_mode=model_utils_mod.model_should_use_json_mode(model),
-            # context
-            db=InMemoryDb(),
-            add_datetime_to_context=True,
-            add_history_to_context=True,
-            num_history_runs=5,
-            read_chat_history=True,
-            enable_session_summaries=True,
+        cache_key = (
+            Agent,
+            getattr(model, "id", None),
+            getattr(model, "provider", None),
+        )
+        agent = SuperAgent._agent_cache.get(cache_key)
+        if agent is None:
+            agent = Agent(
+                model=model,
+                # TODO: enable tools when needed
+                # tools=[Crawl4aiTools()],
+                markdown=False,
+                debug_mode=agent_debug_mode_enabled(),
+                instructions=[prompts_mod.SUPER_AGENT_INSTRUCTION],
+                # output format
+                expected_output=prompts_mod.SUPER_AGENT_EXPECTED_OUTPUT,
+                output_schema=SuperAgentOutcome,
+                use_json_mode=model_utils_mod.model_should_use_json_mode(model),
+                # context
+                db=InMemoryDb(),
+                add_datetime_to_context=True,
+                add_history_to_context=True,
+                num_history_runs=5,
+                read_chat_history=True,
+                enable_session_summaries=True,
+            )
+            SuperAgent._agent_cache[cache_key] = agent
+        self.agent = agent
+
+        # The model is fixed per SuperAgent, so build the fallback strings
+        # once instead of per malformed response.
+        agent_model = self.agent.model
+        self._model_description = f"{agent_model.id} (via {agent_model.provider})"
+        self._malformed_template = (
+            "SuperAgent produced a malformed response: `{outcome}`. "
+            f"Please check the capabilities of your model `{self._model_description}` "
+            "and try again later."
         )
 
     async def run(self, user_input: UserInput) -> SuperAgentOutcome:
-        """Run super agent triage."""
-        await asyncio.sleep(0)
+        """Run super agent triage, coalescing identical concurrent requests."""
+        fast = try_fast_answer(user_input.query)
+        if fast is not None:
+            return fast
 
+        meta = user_input.meta
+        key = hashlib.sha256(
+            f"{prompts_mod.SUPER_AGENT_PREFIX.sha256}|{meta.user_id}|"
+            f"{meta.conversation_id}|{user_input.query}".encode("utf-8")
+        ).digest()
+
+        inflight = _INFLIGHT.get(key)
+        if inflight is not None:
+            # Shield so a cancelled duplicate does not cancel the shared call
+            return await asyncio.shield(inflight)
+
+        task = asyncio.ensure_future(self._triage(user_input))
+        _INFLIGHT[key] = task
+        try:
+            # Shield the owner too: cancelling the first caller (e.g. a client
+            # disconnect) must not cancel the shared task out from under the
+            # coalesced duplicates awaiting it.
+            return await asyncio.shield(task)
+        finally:
+            _INFLIGHT.pop(key, None)
+
+    async def _triage(self, user_input: UserInput) -> SuperAgentOutcome:
+        # Detect the reply language cheaply in Python and pass it as a hint,
+        # instead of spending model attention on re-detecting it per call.
+        lang_hint = detect_language_hint(user_input.query)
+
+        # Intentionally no `await asyncio.sleep(0)` here: arun() awaits soon
+        # enough, and an unconditional yield only adds a scheduling round-trip
+        # per triage call.
         response = await self.agent.arun(
-            user_input.query,
+            f"[lang={lang_hint}]\n{user_input.query}",
             session_id=user_input.meta.conversation_id,
             user_id=user_input.meta.user_id,
-            add_history_to_context=True,
         )
         outcome = response.content
         if not isinstance(outcome, SuperAgentOutcome):
-            model = self.agent.model
-            model_description = f"{model.id} (via {model.provider})"
-            answer_content = (
-                f"SuperAgent produced a malformed response: `{outcome}`. "
-                f"Please check the capabilities of your model `{model_description}` and try again later."
-            )
-            outcome = SuperAgentOutcome(
-                decision=SuperAgentDecision.ANSWER,
-                answer_content=answer_content,
+            preview = repr(outcome)
+            if len(preview) > _MALFORMED_PREVIEW_MAX:
+                # Keep full diagnostics in the log without embedding a
+                # multi-KB blob in the user-visible response.
+                logger.debug("SuperAgent malformed response (full): %s", preview)
+                preview = preview[: _MALFORMED_PREVIEW_MAX - 3] + "..."
+            answer_content = self._malformed_template.format(outcome=preview)
+            outcome = _MALFORMED_OUTCOME_TEMPLATE.model_copy(
+                update={"answer_content": answer_content}
             )
         return outcome
@@ -4,68 +4,182 @@ This module defines concise instructions and expected output format for the
 frontline Super Agent. The Super Agent triages the user's request and either
 answers directly (for simple, factual, or light-weight tasks) or hands off to
 the Planner for structured task execution.
-"""
 
-# noqa: E501
-SUPER_AGENT_INSTRUCTION = """
-<purpose>
-You are a frontline Super Agent that triages incoming user requests.
-Your job is to:
-- If the request is simple or factual and can be answered safely and directly, answer it.
-- Otherwise, hand off to the Planner by returning a concise, well-formed `enriched_query` that preserves the user's intention.
-</purpose>
-
-<answering_principles>
-- Do your best to satisfy the user's request. Avoid saying "can't".
-- Be factual and concise. Do not hallucinate or include unrelated content.
-- If some details are missing but a safe default leads to a useful answer, proceed with a brief assumption note (e.g., "Assuming latest period...").
-- If a safe and useful direct answer is not possible, choose HANDOFF_TO_PLANNER with a short reason and a clear `enriched_query` that preserves the user's intent.
-- Always respond in the user's language.
-</answering_principles>
-
-<core_rules>
-1) Safety and scope
-- Do not provide illegal or harmful guidance.
-- Do not make financial, legal, or medical advice; prefer handing off to Planner if in doubt.
-
-2) Direct answer policy
-- Only answer when you're confident the user expects an immediate short reply without additional tooling.
-- Provide best-effort, concise, and directly relevant answers. If you use a reasonable default, state it briefly.
-- Never use defeatist phrasing (e.g., "I can't"). If uncertain or unsafe, handoff_to_planner instead of refusing.
-
-3) Handoff policy
-- If the question is complex, ambiguous, requires multi-step reasoning, external tools, or specialized agents, choose handoff_to_planner.
-- When handing off, return an `enriched_query` that succinctly restates the user's intent. Do not invent details.
-- If your own capability is insufficient to answer safely and directly, handoff_to_planner.
-
-4) No clarification rounds
-- Do not ask the user for more information. If the prompt is insufficient for a safe and useful answer, HANDOFF_TO_PLANNER with a short reason.
-</core_rules>
- 
-<decision_matrix>
-- Simple, factual, safe to answer → decision=answer with a short reply.
-- Complex/ambiguous/needs tools or specialized agents → decision=handoff_to_planner with enriched_query and brief reason.
-- Missing detail but a safe default yields value → decision=answer with a brief assumption note; otherwise handoff_to_planner.
-</decision_matrix>
+The prompt bodies live as resource files under ``prompt_data/`` and are read,
+compacted, and memoized on first attribute access (PEP 562). Importing this
+module therefore costs no prompt I/O, no multi-KB string constants in the
+.pyc, and no resident copies in processes that never touch the Super Agent.
 """
 
+import hashlib
+import re
+import uuid
+from dataclasses import dataclass
+from functools import cache, lru_cache
+from importlib import resources
+from typing import Optional, Sequence
+
+
+def _compact(text: str) -> str:
+    """Collapse whitespace runs in static prompt text.
+
+    Horizontal whitespace runs become a single space, indentation and blank
+    lines are dropped. Prefill cost scales with prompt length, so every
+    token saved here is saved on each request (and in each cached KV copy).
+    """
+    text = re.sub(r"[ \t]+", " ", text)
+    text = re.sub(r" ?\n ?", "\n", text)
+    text = re.sub(r"\n{2,}", "\n", text)
+    return text.strip()
+
+
+@cache
+def _load_prompt(stem: str) -> str:
+    """Read and compact a prompt body from ``prompt_data/<stem>.txt`` once."""
+    return _compact(
+        resources.files(__package__)
+        .joinpath("prompt_data", f"{stem}.txt")
+        .read_text(encoding="utf-8")
+    )
+
+
+@lru_cache(maxsize=None)
+def _tokenize(tokenizer, text: str) -> tuple:
+    """Tokenize static prompt text once per (tokenizer, text) pair."""
+    return tuple(tokenizer.encode(text))
+
+
+def get_instruction_tokens(tokenizer) -> tuple:
+    """Return cached token IDs of SUPER_AGENT_INSTRUCTION for `tokenizer`.
+
+    Backends that accept pre-tokenized input can use this to skip
+    re-tokenizing the identical instruction text on every request. The
+    tokenizer only needs an `encode(text) -> sequence[int]` method.
+    """
+    return _tokenize(tokenizer, _load_prompt("super_agent_instruction"))
+
+
+def get_expected_output_tokens(tokenizer) -> tuple:
+    """Return cached token IDs of SUPER_AGENT_EXPECTED_OUTPUT for `tokenizer`."""
+    return _tokenize(tokenizer, _load_prompt("super_agent_expected_output"))
+
+
+@dataclass(frozen=True)
+class CachedPrefix:
+    """A stable prompt prefix eligible for backend prefix (KV) caching.
+
+    The Super Agent prepends the same instruction + expected-output text to
+    every request, always in the same order and never interleaved with
+    per-request content, so inference backends with prefix caching (vLLM,
+    llama.cpp, TRT-LLM) can reuse the prefill for this segment on every call.
+    The sha256 identifies the exact prefix revision for cache keying.
+    """
+
+    text: str
+    sha256: str
+
+    def tokens(self, tokenizer) -> tuple:
+        """Cached token IDs of the prefix for `tokenizer`."""
+        return _tokenize(tokenizer, self.text)
+
+
+def _cached_prefix(text: str) -> CachedPrefix:
+    return CachedPrefix(
+        text=text, sha256=hashlib.sha256(text.encode("utf-8")).hexdigest()
+    )
+
 
-SUPER_AGENT_EXPECTED_OUTPUT = """
-<response_requirements>
-Output valid JSON only (no markdown, backticks, or comments) and conform to this schema:
+@dataclass(frozen=True)
+class CachedPromptSegment:
+    """An independently cacheable module of a prompt.
 
-{
-	"decision": "answer" | "handoff_to_planner",
-	"answer_content": "Optional direct answer when decision is 'answer'",
-	"enriched_query": "Optional concise restatement to forward to Planner",
-	"reason": "Brief rationale for the decision"
+    Splitting the prefix into segments lets runtimes that support modular
+    attention-state reuse share the KV blocks of a segment across every
+    agent that embeds it, instead of re-caching each agent's full
+    concatenation. The uid is derived deterministically from the segment
+    name and content hash, so it is stable across processes for the same
+    prompt revision.
+    """
+
+    name: str
+    text: str
+    sha256: str
+    uid: uuid.UUID
+
+    def tokens(self, tokenizer) -> tuple:
+        """Cached token IDs of this segment for `tokenizer`."""
+        return _tokenize(tokenizer, self.text)
+
+
+def _segment(name: str, text: str) -> CachedPromptSegment:
+    digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+    return CachedPromptSegment(
+        name=name,
+        text=text,
+        sha256=digest,
+        uid=uuid.uuid5(
+            uuid.NAMESPACE_URL, f"valuecell://prompt-segment/{name}/{digest}"
+        ),
+    )
+
+
+@cache
+def _instruction_segment() -> CachedPromptSegment:
+    return _segment("super_agent_instruction", _load_prompt("super_agent_instruction"))
+
+
+@cache
+def _output_segment() -> CachedPromptSegment:
+    return _segment(
+        "super_agent_expected_output", _load_prompt("super_agent_expected_output")
+    )
+
+
+@cache
+def _prompt_segments() -> tuple:
+    # Canonical segment order; request builders must never interleave
+    # per-request content between these.
+    return (_instruction_segment(), _output_segment())
+
+
+@cache
+def _prefix() -> CachedPrefix:
+    return _cached_prefix("\n".join(segment.text for segment in _prompt_segments()))
+
+
+# Lazily resolved module attributes (PEP 562); each builder memoizes, so the
+# text is read and derived objects are built at most once per process.
+_LAZY_ATTRS = {
+    "SUPER_AGENT_INSTRUCTION": lambda: _load_prompt("super_agent_instruction"),
+    "SUPER_AGENT_EXPECTED_OUTPUT": lambda: _load_prompt("super_agent_expected_output"),
+    "SUPER_AGENT_PREFIX": _prefix,
+    "INSTRUCTION_SEGMENT": _instruction_segment,
+    "OUTPUT_SEGMENT": _output_segment,
+    "PROMPT_SEGMENTS": _prompt_segments,
 }
 
-Rules:
-- When decision == "answer": include a short `answer_content` and skip `enriched_query`.
-- When decision == "handoff_to_planner": prefer including `enriched_query` that preserves the user intent.
-- Keep `reason` short and helpful.
-- Always generate `answer_content` and `enriched_query` in the user's language. Detect language from the user's query if no explicit locale is provided.
-- Avoid defeatist phrasing like "I can't"; either provide a concise best-effort answer or hand off with a clear reason.
-</response_requirements>
-"""
+
+def __getattr__(name: str):
+    try:
+        builder = _LAZY_ATTRS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    return builder()
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY_ATTRS))
+
+
+def build_prompt(
+    user_query: str, segments: Optional[Sequence[CachedPromptSegment]] = None
+) -> str:
+    """Join prompt segments in canonical order, then the user query.
+
+    Segments and the query are newline-separated so adjacent segment
+    boundaries (e.g. `</decision_matrix>` / `<response_requirements>`) do
+    not fuse onto one line.
+    """
+    if segments is None:
+        segments = _prompt_segments()
+    return "\n".join([segment.text for segment in segments] + [user_query])
@@ -57,11 +57,149 @@ async def test_super_agent_run_uses_underlying_agent(monkeypatch: pytest.MonkeyP
     instance = agent_instance_holder["instance"]
     instance.arun.assert_awaited_once()
     called_args, called_kwargs = instance.arun.call_args
-    assert called_args[0] == "answer this"
+    assert called_args[0] == "[lang=en]\nanswer this"
     assert called_kwargs["session_id"] == "conv-sa"
     assert called_kwargs["user_id"] == "user-sa"
 
 
+@pytest.mark.asyncio
+async def test_super_agent_history_configured_on_agent_not_per_call(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """History inclusion is set once at Agent construction, not re-passed per arun call."""
+
+    fake_response = SimpleNamespace(
+        content=SuperAgentOutcome(decision=SuperAgentDecision.ANSWER)
+    )
+    constructor_kwargs: dict[str, object] = {}
+
+    class FakeAgent:
+        def __init__(self, *args, **kwargs):
+            constructor_kwargs.update(kwargs)
+            self.arun = AsyncMock(return_value=fake_response)
+            self.model = SimpleNamespace(id="fake-model", provider="fake-provider")
+
+    monkeypatch.setattr(super_agent_mod, "Agent", FakeAgent)
+    monkeypatch.setattr(
+        super_agent_mod.model_utils_mod,
+        "get_model_for_agent",
+        lambda *args, **kwargs: "stub-model",
+    )
+    monkeypatch.setattr(super_agent_mod, "agent_debug_mode_enabled", lambda: False)
+
+    sa = SuperAgent()
+    user_input = UserInput(
+        query="with history",
+        target_agent_name=sa.name,
+        meta=UserInputMetadata(conversation_id="conv", user_id="user"),
+    )
+
+    await sa.run(user_input)
+
+    assert constructor_kwargs["add_history_to_context"] is True
+    _, called_kwargs = sa.agent.arun.call_args
+    assert "add_history_to_context" not in called_kwargs
+
+
+@pytest.mark.asyncio
+async def test_super_agent_coalesces_identical_concurrent_requests(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """Concurrent duplicates of the same triage request share one LLM call."""
+
+    import asyncio
+
+    call_count = 0
+    outcome = SuperAgentOutcome(
+        decision=SuperAgentDecision.ANSWER, answer_content="shared"
+    )
+
+    class FakeAgent:
+        def __init__(self, *args, **kwargs):
+            self.model = SimpleNamespace(id="fake-model", provider="fake-provider")
+
+        async def arun(self, *args, **kwargs):
+            nonlocal call_count
+            call_count += 1
+            await asyncio.sleep(0.01)
+            return SimpleNamespace(content=outcome)
+
+    monkeypatch.setattr(super_agent_mod, "Agent", FakeAgent)
+    monkeypatch.setattr(
+        super_agent_mod.model_utils_mod,
+        "get_model_for_agent",
+        lambda *args, **kwargs: "stub-model",
+    )
+    monkeypatch.setattr(super_agent_mod, "agent_debug_mode_enabled", lambda: False)
+
+    sa = SuperAgent()
+    user_input = UserInput(
+        query="same question",
+        target_agent_name=sa.name,
+        meta=UserInputMetadata(conversation_id="conv", user_id="user"),
+    )
+
+    results = await asyncio.gather(sa.run(user_input), sa.run(user_input))
+
+    assert call_count == 1
+    assert all(result is outcome for result in results)
+
+    # Once the in-flight call finishes, a later identical request runs again
+    again = await sa.run(user_input)
+    assert call_count == 2
+    assert again is outcome
+
+
+@pytest.mark.asyncio
+async def test_super_agent_cancelled_caller_does_not_cancel_coalesced_peers(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """Cancelling the first caller must not kill the shared in-flight call."""
+
+    import asyncio
+
+    outcome = SuperAgentOutcome(
+        decision=SuperAgentDecision.ANSWER, answer_content="survives"
+    )
+    started = asyncio.Event()
+
+    class FakeAgent:
+        def __init__(self, *args, **kwargs):
+            self.model = SimpleNamespace(id="fake-model", provider="fake-provider")
+
+        async def arun(self, *args, **kwargs):
+            started.set()
+            await asyncio.sleep(0.01)
+            return SimpleNamespace(content=outcome)
+
+    monkeypatch.setattr(super_agent_mod, "Agent", FakeAgent)
+    monkeypatch.setattr(
+        super_agent_mod.model_utils_mod,
+        "get_model_for_agent",
+        lambda *args, **kwargs: "stub-model",
+    )
+    monkeypatch.setattr(super_agent_mod, "agent_debug_mode_enabled", lambda: False)
+
+    sa = SuperAgent()
+    user_input = UserInput(
+        query="same question",
+        target_agent_name=sa.name,
+        meta=UserInputMetadata(conversation_id="conv", user_id="user"),
+    )
+
+    owner = asyncio.ensure_future(sa.run(user_input))
+    await started.wait()
+    duplicate = asyncio.ensure_future(sa.run(user_input))
+    await asyncio.sleep(0)
+
+    owner.cancel()
+    result = await duplicate
+
+    assert result is outcome
+    with pytest.raises(asyncio.CancelledError):
+        await owner
+
+
 def test_super_agent_prompts_are_non_empty():
     from valuecell.core.super_agent.prompts import (
         SUPER_AGENT_EXPECTED_OUTPUT,
@@ -72,6 +210,91 @@ def test_super_agent_prompts_are_non_empty():
     assert '"decision"' in SUPER_AGENT_EXPECTED_OUTPUT
 
 
+@pytest.mark.asyncio
+async def test_super_agent_fast_path_skips_model_call(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """Trivial greetings are answered without hitting the underlying agent."""
+
+    class FakeAgent:
+        def __init__(self, *args, **kwargs):
+            self.arun = AsyncMock()
+            self.model = SimpleNamespace(id="fake-model", provider="fake-provider")
+
+    monkeypatch.setattr(super_agent_mod, "Agent", FakeAgent)
+    monkeypatch.setattr(
+        super_agent_mod.model_utils_mod,
+        "get_model_for_agent",
+        lambda *args, **kwargs: "stub-model",
+    )
+    monkeypatch.setattr(super_agent_mod, "agent_debug_mode_enabled", lambda: False)
+
+    sa = SuperAgent()
+    user_input = UserInput(
+        query="Hello!",
+        target_agent_name=sa.name,
+        meta=UserInputMetadata(conversation_id="conv", user_id="user"),
+    )
+
+    outcome = await sa.run(user_input)
+
+    assert outcome.decision == SuperAgentDecision.ANSWER
+    assert outcome.answer_content
+    sa.agent.arun.assert_not_awaited()
+
+    # A query with real intent must not match the fast path
+    from valuecell.core.super_agent.core import try_fast_answer
+
+    assert try_fast_answer("What was Tesla's Q3 revenue?") is None
+    assert try_fast_answer("hi, can you check AAPL?") is None
+
+
+def test_detect_language_hint_scripts():
+    from valuecell.utils.i18n_utils import detect_language_hint
+
+    assert detect_language_hint("what is tesla's revenue?") == "en"
+    assert detect_language_hint("特斯拉的营收是多少？") == "zh"
+    assert detect_language_hint("テスラの収益は？") == "ja"
+    assert detect_language_hint("테슬라의 수익은?") == "ko"
+    assert detect_language_hint("Какая выручка у Теслы?") == "ru"
+
+
+def test_super_agent_prompts_have_compacted_whitespace():
+    from valuecell.core.super_agent.prompts import (
+        SUPER_AGENT_EXPECTED_OUTPUT,
+        SUPER_AGENT_INSTRUCTION,
+    )
+
+    for prompt in (SUPER_AGENT_INSTRUCTION, SUPER_AGENT_EXPECTED_OUTPUT):
+        assert "\t" not in prompt
+        assert "  " not in prompt
+        assert "\n\n" not in prompt
+        assert prompt == prompt.strip()
+
+
+def test_super_agent_prompt_tokens_are_cached_per_tokenizer():
+    from valuecell.core.super_agent import prompts
+
+    class CountingTokenizer:
+        def __init__(self):
+            self.calls = 0
+
+        def encode(self, text: str):
+            self.calls += 1
+            return [ord(ch) for ch in text[:4]]
+
+    tokenizer = CountingTokenizer()
+    first = prompts.get_instruction_tokens(tokenizer)
+    second = prompts.get_instruction_tokens(tokenizer)
+
+    assert first == second
+    assert tokenizer.calls == 1
+    # A different tokenizer gets its own cached entry
+    other = CountingTokenizer()
+    prompts.get_instruction_tokens(other)
+    assert other.calls == 1
+
+
 @pytest.mark.asyncio
 async def test_super_agent_service_delegates_to_underlying_agent():
     fake_agent = SimpleNamespace(
@@ -2,6 +2,7 @@
 
 import re
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
@@ -17,6 +18,45 @@ from ..config.constants import (
 from ..server.services.i18n_service import get_i18n_service
 
 
+@lru_cache(maxsize=4096)
+def detect_language_hint(text: str) -> str:
+    """Best-effort language hint from the Unicode scripts used in `text`.
+
+    This is a cheap heuristic (microseconds, no model call) intended as a
+    hint for LLM prompts, not an authoritative language identification:
+    kana implies Japanese, hangul Korean, han Chinese, and so on, with
+    Latin-script text defaulting to English.
+
+    Args:
+        text: Text to inspect
+
+    Returns:
+        Two-letter language code hint (e.g. "en", "zh", "ja")
+    """
+    has_han = False
+    has_cyrillic = False
+    has_arabic = False
+    for ch in text:
+        cp = ord(ch)
+        if 0x3040 <= cp <= 0x30FF:  # hiragana/katakana
+            return "ja"
+        if 0xAC00 <= cp <= 0xD7AF or 0x1100 <= cp <= 0x11FF:  # hangul
+            return "ko"
+        if 0x4E00 <= cp <= 0x9FFF or 0x3400 <= cp <= 0x4DBF:  # han
+            has_han = True
+        elif 0x0400 <= cp <= 0x04FF:  # cyrillic
+            has_cyrillic = True
+        elif 0x0600 <= cp <= 0x06FF:  # arabic
+            has_arabic = True
+    if has_han:
+        return "zh"
+    if has_cyrillic:
+        return "ru"
+    if has_arabic:
+        return "ar"
+    return "en"
+
+
 def detect_browser_language(accept_language_header: str) -> str:
     """Detect preferred language from browser Accept-Language header.
 
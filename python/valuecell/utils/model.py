@@ -11,6 +11,7 @@ Migration Notes:
 
 import logging
 import os
+from functools import lru_cache
 from typing import Optional
 
 from agno.models.base import Model as AgnoModel
@@ -27,21 +28,23 @@ from valuecell.adapters.models.factory import (
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=32)
+def _should_use_json_mode(provider: Optional[str], name: Optional[str]) -> bool:
+    if provider == AgnoGeminiModel.provider and name == AgnoGeminiModel.name:
+        return True
+    if provider == AgnoOpenAIChatModel.provider and name == AgnoOpenAIChatModel.name:
+        return True
+    return False
+
+
 def model_should_use_json_mode(model: AgnoModel) -> bool:
     try:
-        provider = getattr(model, "provider", None)
-        name = getattr(model, "name", None)
-        if provider == AgnoGeminiModel.provider and name == AgnoGeminiModel.name:
-            return True
-        if (
-            provider == AgnoOpenAIChatModel.provider
-            and name == AgnoOpenAIChatModel.name
-        ):
-            return True
+        return _should_use_json_mode(
+            getattr(model, "provider", None), getattr(model, "name", None)
+        )
     except Exception:
         # Any unexpected condition falls back to standard (non-JSON) mode
         return False
-    return False
 
 
 def get_model(env_key: str, **kwargs):